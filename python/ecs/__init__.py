@@ -1,3 +1,30 @@
-from .ecs_dynamodb import *
 from .ecs_api_interface import *
-from .ecs_email_client import *
+
+# ecs_dynamodb and ecs_email_client need boto3, which is slow to import, so they're only
+# imported the first time something from them is used, and they only import boto3 inside
+# the functions that need it. That way, Lambda functions that only use EcsApiInterface
+# don't pay for boto3 on every cold start.
+_lazy_names = {
+    "dynamodb_item_to_json": ".ecs_dynamodb",
+    "DynamoDB": ".ecs_dynamodb",
+    "EmailClient": ".ecs_email_client",
+}
+
+__all__ = ["EcsApiInterface", *_lazy_names]
+
+
+def __getattr__(name):
+    import importlib
+    if name in _lazy_names:
+        value = getattr(importlib.import_module(_lazy_names[name], __name__), name)
+    elif name in ("ecs_dynamodb", "ecs_email_client"):
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Once it's in the module's globals, __getattr__ won't be called for this name again.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_names))
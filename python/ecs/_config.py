@@ -0,0 +1,15 @@
+import functools
+import pathlib
+import types
+from . import _jsonlib
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> types.MappingProxyType:
+    """Reads and parses config.json from the pwd.
+
+    config.json never changes while a Lambda function is running, so it's only parsed once
+    per process and every ecs.DynamoDB and ecs.EmailClient shares the result. Since it's
+    shared, it's returned as a read-only mapping.
+    """
+    return types.MappingProxyType(_jsonlib.loads(pathlib.Path("config.json").read_bytes()))
@@ -0,0 +1,28 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    # orjson isn't part of the Lambda runtime, so it's only used when it has been bundled into the layer.
+    orjson = None
+
+
+def dumps(obj, default=None, indent: int = None) -> bytes:
+    """Serializes obj as UTF-8 encoded JSON, using orjson if it's available.
+
+    orjson can only indent with two spaces, so any other indent falls back to the json module.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    # ensure_ascii=False writes non-ASCII text as is, the same way orjson does.
+    return json.dumps(obj, default=default, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes):
+    """Deserializes JSON from a bytes object, using orjson if it's available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
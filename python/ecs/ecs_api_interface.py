@@ -1,5 +1,45 @@
-import json
-import urllib3
+import http.client
+import select
+import threading
+import types
+import urllib.parse
+from . import _jsonlib
+
+# EcsApiInterface only ever talks to a single host per instance (api.ecs.rocks, unless told otherwise),
+# so it uses plain http.client connections rather than going through urllib3's pool and retry machinery.
+# Connections are kept alive and shared by every instance, but each thread gets its own, since an
+# HTTPConnection can't be used by two threads at once.
+_local = threading.local()
+
+# Seconds to wait to connect or for a response. Without a timeout, a connection left half-open
+# while a Lambda container was frozen would block forever instead of failing.
+_TIMEOUT = 30
+
+
+def _connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """Returns this thread's connection to netloc, opening it the first time it's needed."""
+    connections = _local.__dict__.setdefault("connections", {})
+    conn = connections.get((scheme, netloc))
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = connections[(scheme, netloc)] = conn_class(netloc, timeout=_TIMEOUT)
+    elif conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+        # An idle connection only becomes readable when the server has closed it, so it's
+        # thrown away here rather than failing partway through the next request.
+        conn.close()
+    return conn
+
+
+def _send(conn: http.client.HTTPConnection, verb: str, path: str, body: bytes, headers) -> bytes:
+    """Sends a request over conn and returns the body of the response."""
+    try:
+        conn.request(verb, path, body=body, headers=headers)
+        return conn.getresponse().read()
+    except BaseException:
+        # A connection that failed partway through a request can't be used for another one,
+        # so close it. The next request will open a fresh connection.
+        conn.close()
+        raise
 
 
 class EcsApiInterface:
@@ -24,25 +64,39 @@ class EcsApiInterface:
 
     """
 
+    # Shared by every call, so it's read-only.
+    _DEFAULT_HEADERS = types.MappingProxyType({"Content-Type": "application/json"})
+
     def __init__(self, method_path: str, base_url: str = "https://api.ecs.rocks"):
-        self._http = urllib3.PoolManager()
-        self._endpoint_url = base_url + method_path
+        # The URL is split up once here rather than on every call.
+        url = urllib.parse.urlsplit(base_url)
+        self._scheme = url.scheme
+        self._netloc = url.netloc
+        self._method_path = url.path.rstrip("/") + method_path
 
-    def __call__(self, request_data: dict, verb: str = "POST", headers: dict = None):
+    def __call__(self, request_data: dict, verb: str = "POST", headers: dict = None, raw: bool = False):
         """The function call operator is overloaded to call the API method passed to the ctor.
 
         :param request_data: the payload to send to the API (must be a JSON serializable dict)
         :param verb: the HTTP verb to use (defaults to POST)
         :param headers: request headers to be passed along with the payload (you probably don't need to use this)
+        :param raw: (optional) if True, return the response body as bytes without parsing it as JSON, which is
+            handy if you're just going to pass it along somewhere else (e.g. returning it from a Lambda function)
         :return: response from the API
         """
-        default_headers = {"Content-Type": "application/json"}
+        body = _jsonlib.dumps(request_data)
+        headers = self._DEFAULT_HEADERS if headers is None else headers
 
-        result = self._http.request(
-            verb,
-            self._endpoint_url,
-            body=json.dumps(request_data),
-            headers=(default_headers if headers is None else headers)
-        )
+        conn = _connection(self._scheme, self._netloc)
+        reused = conn.sock is not None
+        try:
+            data = _send(conn, verb, self._method_path, body, headers)
+        except http.client.RemoteDisconnected:
+            # The server closed our kept-alive connection while it was idle, without sending a
+            # response, so reconnect and try once more. Other errors aren't retried, since the
+            # server may already have handled the request.
+            if not reused:
+                raise
+            data = _send(conn, verb, self._method_path, body, headers)
 
-        return json.loads(result.data.decode("utf-8"))
+        return data if raw else _jsonlib.loads(data)
@@ -1,7 +1,41 @@
-import json
 import decimal
-import boto3
-from boto3.dynamodb.conditions import Key
+import functools
+from . import _config, _jsonlib
+
+
+# Creating a boto3 resource means loading and parsing botocore's service models, which is slow,
+# so resources and Table objects are built once per process and shared between DynamoDB instances.
+@functools.lru_cache(maxsize=None)
+def _dynamodb_resource(region_name: str, endpoint_url: str):
+    import boto3
+    return boto3.resource("dynamodb", region_name=region_name, endpoint_url=endpoint_url)
+
+
+@functools.lru_cache(maxsize=None)
+def _dynamodb_table(region_name: str, endpoint_url: str, table_name: str):
+    return _dynamodb_resource(region_name, endpoint_url).Table(table_name)
+
+
+# Some hot paths skip the Table resource and call a low-level DynamoDB client directly,
+# converting between Python values and DynamoDB AttributeValues themselves. This has to be
+# a client of its own: the resource's meta.client already converts values for the resource.
+@functools.lru_cache(maxsize=None)
+def _dynamodb_client(region_name: str, endpoint_url: str):
+    import boto3
+    return boto3.client("dynamodb", region_name=region_name, endpoint_url=endpoint_url)
+
+
+@functools.lru_cache(maxsize=1)
+def _type_converters():
+    from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
+    return TypeSerializer(), TypeDeserializer()
+
+
+def _decimal_to_float(obj):
+    # Hook for the JSON encoder, which calls it for any value it doesn't know how to serialize.
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def dynamodb_item_to_json(item: dict, indent: int = None) -> str:
@@ -10,20 +44,15 @@ def dynamodb_item_to_json(item: dict, indent: int = None) -> str:
     Amazon's DynamoDB API for Python returns numbers as decimal.Decimal
     instances instead of ints or floats. This makes it so that you can't
     just call json.dumps on an item retrieved from DynamoDB. If you want to
-    serialize a DynamoDB item to JSON, you can just use this function.
+    serialize a DynamoDB item to JSON, you can just use this function. Numbers
+    are converted to floats wherever they are in the item, including inside
+    nested lists and maps.
 
     :param item: the DynamoDB item to serialize
     :param indent: (optional) number of spaces with which to indent the JSON
     :return: the item as a JSON string
     """
-    result = {}
-    for key in item.keys():
-        if type(item[key]) is decimal.Decimal:
-            result[key] = float(item[key])
-        else:
-            result[key] = item[key]
-
-    return json.dumps(result, indent=indent)
+    return _jsonlib.dumps(item, default=_decimal_to_float, indent=indent).decode("utf-8")
 
 
 class DynamoDB:
@@ -48,6 +77,13 @@ class DynamoDB:
     This class's ctor requires you to have a config.json in your Lambda function's directory to specify the Amazon
     region name and DynamoDB endpoint URL.
 
+    ----
+
+    To keep construction cheap, every ecs.DynamoDB in a process shares one boto3 resource, and
+    instances for the same table share one Table object. boto3 resources aren't thread-safe, so
+    if you use this class from several threads, don't let them use the table property (or the
+    methods that go through it, like []=, len() and get_all_items) at the same time.
+
     """
 
     def __init__(self, table_name: str, primary_key_name: str):
@@ -61,19 +97,19 @@ class DynamoDB:
         self._primary_key = primary_key_name
         self._table_name = table_name
         try:
-            config_file = open("config.json")
-            self._config_options = json.loads(config_file.read())
+            self._config_options = _config.load_config()
         except FileNotFoundError:
             raise FileNotFoundError((
                 "Unable to find config.json. "
                 "You need config.json in your pwd to use the ecs.DynamoDB class."
             ))
-        self._boto_dynamodb_client = boto3.resource(
-            "dynamodb",
-            region_name=self._config_options["region-name"],
-            endpoint_url=self._config_options["endpoint-url"]
-        )
-        self._table = self._boto_dynamodb_client.Table(self._table_name)
+        region_name = self._config_options["region-name"]
+        endpoint_url = self._config_options["endpoint-url"]
+        self._boto_dynamodb_client = _dynamodb_resource(region_name, endpoint_url)
+        self._table = _dynamodb_table(region_name, endpoint_url, self._table_name)
+        # A low-level client, for the hot paths that skip the Table object.
+        self._client = _dynamodb_client(region_name, endpoint_url)
+        self._serializer, self._deserializer = _type_converters()
 
         # To ensure that creating new DynamoDB objects isn't too expensive,
         # the length of a table is lazily evaulated. Read the implementation
@@ -93,8 +129,44 @@ class DynamoDB:
         :param value: value of the desired item's primary key
         :return: the item whose primary key is the requisite value
         """
-        data = self._table.get_item(Key={self._primary_key: value})
-        return data["Item"]
+        data = self._client.get_item(
+            TableName=self._table_name,
+            Key={self._primary_key: self._serializer.serialize(value)}
+        )
+        return self._deserialize_item(data["Item"])
+
+    def get(self, value, fields: list = None):
+        """Method to get an item from the table, or just some of its attributes.
+
+        ----
+
+        This works like the [] operator, except that it returns None if there's no item with
+        the given primary key value (just like dict.get). If you only need some of an item's
+        attributes, you can list them in fields, and only those attributes will be fetched
+        from DynamoDB, which saves bandwidth and read capacity on tables with big items:
+            table.get("123456", fields=["foo", "bar"])
+
+        ----
+
+        :param value: value of the desired item's primary key
+        :param fields: (optional) names of the attributes to fetch (by default, all of them are fetched)
+        :return: the item whose primary key is the requisite value, or None if there isn't one
+        """
+        kwargs = {}
+        if fields:
+            # Attribute names are passed as placeholders so that names which are
+            # reserved words in DynamoDB (like "name" or "data") still work.
+            kwargs["ProjectionExpression"] = ",".join(f"#f{i}" for i in range(len(fields)))
+            kwargs["ExpressionAttributeNames"] = {f"#f{i}": field for i, field in enumerate(fields)}
+
+        data = self._client.get_item(
+            TableName=self._table_name,
+            Key={self._primary_key: self._serializer.serialize(value)},
+            **kwargs
+        )
+        if "Item" not in data:
+            return None
+        return self._deserialize_item(data["Item"])
 
     def __setitem__(self, value, item: dict):
         """Operator to create or update an item in this object's table.
@@ -135,6 +207,9 @@ class DynamoDB:
 
         return r
 
+    def _deserialize_item(self, item: dict) -> dict:
+        return {key: self._deserializer.deserialize(value) for key, value in item.items()}
+
     @property
     def table(self):
         """Property for accessing the Table object.
@@ -167,11 +242,58 @@ class DynamoDB:
         # The number of entries in the table is lazily evaluated. Any of this class's
         # methods that might change the number of entries in the table will result in
         # the _len attribute being set to None.
+        # Scanning with Select="COUNT" makes DynamoDB send back just the number of
+        # items on each page rather than the items themselves.
         if self._len is None:
-            table_data = self.get_all_items()
-            self._len = len(table_data)
+            self._len = self.get_all_items(Select="COUNT")
         return self._len
 
+    @property
+    def len_approx(self):
+        """Property for getting the approximate number of items in the table.
+
+        ----
+
+        Unlike len(), this doesn't scan the table at all. It returns the ItemCount from the table's
+        description (one DescribeTable call), which DynamoDB only updates about every six hours, so
+        it may be out of date.
+
+        """
+        # This asks DynamoDB for a fresh table description every time, since the Table object
+        # is shared for the life of the process and would otherwise keep its first ItemCount.
+        client = self._boto_dynamodb_client.meta.client
+        return client.describe_table(TableName=self._table_name)["Table"]["ItemCount"]
+
+    def _scan_pages(self, **kwargs):
+        # Yields the response of each scan() operation, passing the LastEvaluatedKey
+        # of one page as the ExclusiveStartKey of the next until the table is exhausted.
+        while True:
+            response = self._table.scan(**kwargs)
+            yield response
+            if "LastEvaluatedKey" not in response:
+                return
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def iter_all_items(self, **kwargs):
+        """Method to iterate over _all_ items from a table, even over the 1MB limit on scan() operations.
+
+        ----
+
+        This works just like get_all_items, except that items are yielded one page at a time as they're
+        retrieved instead of being collected into one big list. If you only need to look at each item once,
+        this lets you start working before the whole table has been downloaded, and keeps memory usage down.
+
+        ----
+
+        :param kwargs: any arguments you want to pass to the scan() operation (except Select="COUNT")
+        :return: a generator over all items in the table
+        """
+        if kwargs.get("Select") == "COUNT":
+            raise ValueError(
+                'iter_all_items can\'t count items. Use get_all_items(Select="COUNT") or len() instead.'
+            )
+        return (item for response in self._scan_pages(**kwargs) for item in response["Items"])
+
     # This method will get _ALL_ the data in a table, even over the 1MB limit. If you don't really
     # need 1MB of data, use `DynamoDB.table.scan()` instead of `DynamoDB.get_all_items()`.
     def get_all_items(self, **kwargs):
@@ -187,16 +309,11 @@ class DynamoDB:
         ----
 
         :param kwargs: any arguments you want to pass to the scan() operation
-        :return: all items in the table
+        :return: all items in the table (or the number of items, if you pass Select="COUNT")
         """
-        response = self._table.scan(**kwargs)
         if kwargs.get("Select") == "COUNT":
-            return response.get("Count")
-        data = response.get("Items")
-        while "LastEvaluatedKey" in response:
-            response = kwargs.get("table").scan(ExclusiveStartKey=response["LastEvaluatedKey"], **kwargs)
-            data.extend(response["Items"])
-        return data
+            return sum(response["Count"] for response in self._scan_pages(**kwargs))
+        return list(self.iter_all_items(**kwargs))
 
     def get_items_by_key_val_pair(self, key: str, value):
         """Method to get items which have a specified value for one of their keys.
@@ -214,7 +331,12 @@ class DynamoDB:
         :param value: desired value for the specified key in the returned items
         :return: items for which item[key] == value
         """
-        data = self._table.query(
-            KeyConditionExpression=Key(key).eq(value)
+        # The key condition is written out as an expression string rather than being built with
+        # boto3's Key(key).eq(value) condition objects, which get rebuilt and compiled on every call.
+        data = self._client.query(
+            TableName=self._table_name,
+            KeyConditionExpression="#k = :v",
+            ExpressionAttributeNames={"#k": key},
+            ExpressionAttributeValues={":v": self._serializer.serialize(value)}
         )
-        return data["Items"]
+        return [self._deserialize_item(item) for item in data["Items"]]
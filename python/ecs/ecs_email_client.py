@@ -1,9 +1,23 @@
-import json
-import boto3
+import functools
+import os
+import email.policy
 from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
-from botocore.exceptions import ClientError
+from . import _config
+
+
+# There's only ever one SES client per region, shared between EmailClient instances,
+# for the same reason the DynamoDB resource is cached in ecs_dynamodb.
+@functools.lru_cache(maxsize=None)
+def _ses_client(region_name: str):
+    import boto3
+    return boto3.client("ses", region_name=region_name)
+
+
+# Policy for serializing messages for send_raw_email. Our messages are built with the
+# MIME* classes, which use the compat32 policy, so we keep it (email.policy.SMTP can't
+# fold non-ASCII headers set by those classes) and only switch to CRLF line endings.
+_RAW_EMAIL_POLICY = email.policy.compat32.clone(linesep="\r\n")
 
 
 class EmailClient:
@@ -24,37 +38,75 @@ class EmailClient:
         self._sender = sender_email_address
         self._charset = charset
         try:
-            config_file = open("config.json")
-            self._config_options = json.loads(config_file.read())
+            self._config_options = _config.load_config()
         except FileNotFoundError:
             raise FileNotFoundError((
                 "Unable to find config.json. "
                 "You need config.json in your pwd to use the ecs.EmailClient class."
             ))
 
-        self._client = boto3.client("ses", region_name=self._config_options["region-name"])
+        self._client = _ses_client(self._config_options["region-name"])
 
-    def _plain_to_text_email(self, message: str) -> str:
-        return ("".join([
-            message,
+        # The boilerplate around the body of every email is the same, so it's
+        # formatted and encoded once here rather than every time we send one.
+        admin_email = self._config_options["admin-email"]
+        self._text_footer = "".join([
             "\r\n-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-",
-            f"\r\nBeep beep! I'm a robot. Email my creator at {self._config_options['admin-email']} if you have questions.",
+            f"\r\nBeep beep! I'm a robot. Email my creator at {admin_email} if you have questions.",
             "\r\n"
-        ]))
-
-    def _plain_to_html_email(self, message: str) -> str:
-        return """
+        ]).encode(self._charset)
+        self._html_header = """
             <html>
             <head></head>
             <body>
-        """ + message.replace("\n", "<br>") + f"""
+        """.encode(self._charset)
+        self._html_footer = f"""
             <hr>
             <small>
-            Beep beep! I'm a robot. Email my creator at {self._config_options['admin-email']} if you have questions.
+            Beep beep! I'm a robot. Email my creator at {admin_email} if you have questions.
             </small>
             </body>
             </html>
-        """
+        """.encode(self._charset)
+
+    def _plain_to_text_email(self, message: str) -> bytes:
+        return message.encode(self._charset) + self._text_footer
+
+    def _plain_to_html_email(self, message: str) -> bytes:
+        return self._html_header + message.replace("\n", "<br>").encode(self._charset) + self._html_footer
+
+    def _build_message(self, subject: str, message: str, tmp_file_attachment_name: str) -> MIMEMultipart:
+        # Builds everything in an email except for its recipient, so the same message can
+        # be addressed and sent to any number of recipients without being rebuilt.
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = self._sender
+        msg.attach(MIMEText(self._plain_to_text_email(message), "plain", self._charset))
+        msg.attach(MIMEText(self._plain_to_html_email(message), "html", self._charset))
+
+        if tmp_file_attachment_name:
+            from email.mime.application import MIMEApplication
+            with open(os.path.join("/tmp", tmp_file_attachment_name), "rb") as attachment_file:
+                part = MIMEApplication(attachment_file.read())
+            part.add_header(
+                "Content-Disposition",
+                "attachment",
+                filename=tmp_file_attachment_name
+            )
+            msg.attach(part)
+
+        return msg
+
+    def _send_message(self, msg: MIMEMultipart, dest_address: str):
+        return self._client.send_raw_email(
+            Source=self._sender,
+            Destinations=[
+                dest_address
+            ],
+            RawMessage={
+                "Data": msg.as_bytes(policy=_RAW_EMAIL_POLICY)
+            }
+        )
 
     def send_email(
             self,
@@ -71,34 +123,50 @@ class EmailClient:
         :param tmp_file_attachment_name: (optional) a file located in /tmp which should be attached to the email
         :return: response from Amazon's SES API
         """
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = self._sender
+        msg = self._build_message(subject, message, tmp_file_attachment_name)
         msg["To"] = dest_address
-        body_text = self._plain_to_text_email(message)
-        body_html = self._plain_to_html_email(message)
-        text_part = MIMEText(body_text.encode(self._charset), "plain", self._charset)
-        html_part = MIMEText(body_html.encode(self._charset), "html", self._charset)
-        msg.attach(text_part)
-        msg.attach(html_part)
+        return self._send_message(msg, dest_address)
 
-        if tmp_file_attachment_name:
-            part = MIMEApplication(open(f"/tmp/{tmp_file_attachment_name}", "rb").read())
-            part.add_header(
-                "Content-Disposition",
-                "attachment",
-                filename=tmp_file_attachment_name
+    def send_emails(
+            self,
+            subject: str,
+            message: str,
+            dest_addresses: list,
+            tmp_file_attachment_name: str = ""
+    ):
+        """The send_emails method. This method attempts to send the same email to each of several addresses.
+
+        ----
+
+        This works like calling send_email once for each address, except that the email is only built once,
+        and then just readdressed for each recipient. Each recipient still gets their own separate email.
+
+        ----
+
+        Emails are sent in the order of dest_addresses. If sending one of them raises an exception, the ones
+        after it aren't sent, but the ones before it already have been, and their responses are lost along with
+        the return value. If you need to know exactly who got the email when something goes wrong, call
+        send_email for each address yourself instead.
+
+        ----
+
+        :param subject: the subject line of the emails
+        :param message: the body of the emails
+        :param dest_addresses: the addresses to which the email should be sent (a list, not a single str)
+        :param tmp_file_attachment_name: (optional) a file located in /tmp which should be attached to the emails
+        :return: list of responses from Amazon's SES API, one for each address
+        """
+        if isinstance(dest_addresses, str):
+            # Iterating over a string would send an email to each of its characters.
+            raise TypeError(
+                "dest_addresses must be a list of addresses, not a str. Use send_email for one address."
             )
-            msg.attach(part)
 
-        response = self._client.send_raw_email(
-            Source=msg["From"],
-            Destinations=[
-                msg["To"]
-            ],
-            RawMessage={
-                "Data": msg.as_string()
-            }
-        )
+        msg = self._build_message(subject, message, tmp_file_attachment_name)
+        responses = []
+        for dest_address in dest_addresses:
+            del msg["To"]
+            msg["To"] = dest_address
+            responses.append(self._send_message(msg, dest_address))
 
-        return response
+        return responses
@@ -0,0 +1,32 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python"))
+
+from ecs import _config, ecs_dynamodb, ecs_email_client  # noqa: E402
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Writes a config.json to a temporary pwd and resets everything cached from a previous test."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    (tmp_path / "config.json").write_text(json.dumps({
+        "region-name": "us-east-1",
+        "endpoint-url": "https://dynamodb.us-east-1.amazonaws.com",
+        "admin-email": "developer@example.com"
+    }))
+    for cached in (
+            _config.load_config,
+            ecs_dynamodb._dynamodb_resource,
+            ecs_dynamodb._dynamodb_table,
+            ecs_dynamodb._dynamodb_client,
+            ecs_email_client._ses_client
+    ):
+        cached.cache_clear()
+    yield
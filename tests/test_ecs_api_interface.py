@@ -0,0 +1,77 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import ecs
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Set on the server to make it hang up after every response without saying so,
+    # like a server that times out idle keep-alive connections.
+    drop_connections = False
+
+    def do_POST(self):
+        request_data = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({"path": self.path, "request": request_data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.server.drop_connections
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(port: int = 0, drop_connections: bool = False) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", port), _EchoHandler)
+    server.drop_connections = drop_connections
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def server():
+    server = _serve()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_call(server):
+    api = ecs.EcsApiInterface("/v0/echo", base_url=f"http://127.0.0.1:{server.server_port}/stage")
+    assert api({"text": "héllo"}) == {"path": "/stage/v0/echo", "request": {"text": "héllo"}}
+    assert json.loads(api({"n": 2}, raw=True)) == {"path": "/stage/v0/echo", "request": {"n": 2}}
+
+
+def test_reconnects_after_idle_connection_is_dropped():
+    server = _serve(drop_connections=True)
+    try:
+        api = ecs.EcsApiInterface("/v0/echo", base_url=f"http://127.0.0.1:{server.server_port}")
+        for n in range(3):
+            assert api({"n": n})["request"] == {"n": n}
+            time.sleep(0.05)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_recovers_after_failed_request():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    api = ecs.EcsApiInterface("/v0/echo", base_url=f"http://127.0.0.1:{port}")
+    with pytest.raises(ConnectionRefusedError):
+        api({"n": 1})
+
+    server = _serve(port)
+    try:
+        assert api({"n": 2})["request"] == {"n": 2}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,72 @@
+import boto3
+import pytest
+from moto import mock_aws
+
+import ecs
+
+
+@pytest.fixture
+def table(config):
+    with mock_aws():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName="Devices",
+            KeySchema=[{"AttributeName": "deviceid", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "deviceid", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST"
+        )
+        t = ecs.DynamoDB("Devices", "deviceid")
+        t["a"] = {"name": "Alpha", "count": 3, "tags": ["x", "y"]}
+        yield t
+
+
+def test_getitem(table):
+    assert table["a"] == {"deviceid": "a", "name": "Alpha", "count": 3, "tags": ["x", "y"]}
+
+
+def test_getitem_missing(table):
+    with pytest.raises(KeyError):
+        table["missing"]
+
+
+def test_len(table):
+    assert len(table) == 1
+    table["b"] = {"name": "Bravo"}
+    assert len(table) == 2
+
+
+def test_len_approx_is_not_cached(table):
+    assert table.len_approx == 1
+    # Written by someone else, so nothing cached on this process's Table object gets reset.
+    boto3.client("dynamodb", region_name="us-east-1").put_item(
+        TableName="Devices",
+        Item={"deviceid": {"S": "b"}}
+    )
+    assert ecs.DynamoDB("Devices", "deviceid").len_approx == 2
+
+
+def test_get_items_by_key_val_pair(table):
+    assert table.get_items_by_key_val_pair("deviceid", "a") == [
+        {"deviceid": "a", "name": "Alpha", "count": 3, "tags": ["x", "y"]}
+    ]
+    assert table.get_items_by_key_val_pair("deviceid", "missing") == []
+
+
+def test_get(table):
+    assert table.get("a") == table["a"]
+    assert table.get("a", fields=["name", "count"]) == {"name": "Alpha", "count": 3}
+    assert table.get("missing") is None
+
+
+def test_get_all_items_over_several_pages(table):
+    for n in range(6):
+        table[f"item-{n}"] = {"n": n}
+
+    items = table.get_all_items(Limit=2)
+    assert sorted(item["deviceid"] for item in items) == ["a"] + [f"item-{n}" for n in range(6)]
+    assert table.get_all_items(Select="COUNT", Limit=2) == 7
+    assert len(list(table.iter_all_items(Limit=2))) == 7
+
+
+def test_iter_all_items_rejects_count(table):
+    with pytest.raises(ValueError):
+        table.iter_all_items(Select="COUNT")
@@ -0,0 +1,118 @@
+import email
+import email.policy
+import os
+import tempfile
+
+import boto3
+import pytest
+from moto import mock_aws
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.ses.models import ses_backends
+
+import ecs
+
+SENDER = "robot@example.com"
+# Long enough, and non-ASCII, so the header has to be encoded and folded.
+SUBJECT = "Résumé of today's readings from every device in the north-east warehouse — ünïcödé"
+MESSAGE = "Hello,\nthe readings are attached.\nCheers ☺"
+
+# The bodies as the ECS module has always written them.
+TEXT_BODY = "".join([
+    MESSAGE,
+    "\r\n-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-",
+    "\r\nBeep beep! I'm a robot. Email my creator at developer@example.com if you have questions.",
+    "\r\n"
+])
+HTML_BODY = """
+            <html>
+            <head></head>
+            <body>
+        """ + MESSAGE.replace("\n", "<br>") + """
+            <hr>
+            <small>
+            Beep beep! I'm a robot. Email my creator at developer@example.com if you have questions.
+            </small>
+            </body>
+            </html>
+        """
+
+
+@pytest.fixture
+def client(config):
+    with mock_aws():
+        boto3.client("ses", region_name="us-east-1").verify_email_identity(EmailAddress=SENDER)
+        yield ecs.EmailClient(SENDER)
+
+
+def sent_messages():
+    return ses_backends[DEFAULT_ACCOUNT_ID]["us-east-1"].sent_messages
+
+
+def raw_bytes(sent) -> bytes:
+    return sent.raw_data.encode("utf-8") if isinstance(sent.raw_data, str) else sent.raw_data
+
+
+def parse(sent) -> email.message.EmailMessage:
+    return email.message_from_bytes(raw_bytes(sent), policy=email.policy.default)
+
+
+@pytest.fixture
+def attachment():
+    # EmailClient only attaches files from /tmp, as in a Lambda function.
+    data = (bytes(range(256)) * 12)[:3000]
+    with tempfile.NamedTemporaryFile(suffix=".bin", dir="/tmp", delete=False) as f:
+        f.write(data)
+    path = f.name
+    yield os.path.basename(path), data
+    os.remove(path)
+
+
+def test_send_email(client, attachment):
+    attachment_name, attachment_data = attachment
+    client.send_email(SUBJECT, MESSAGE, "someone@example.com", tmp_file_attachment_name=attachment_name)
+
+    [sent] = sent_messages()
+    # moto adds the To header's addresses to the Destinations passed to send_raw_email.
+    assert set(sent.destinations) == {"someone@example.com"}
+    assert b"\r\n" in raw_bytes(sent) and b"\n" not in raw_bytes(sent).replace(b"\r\n", b"")
+
+    msg = parse(sent)
+    assert msg["Subject"] == SUBJECT
+    assert msg["From"] == SENDER
+    assert msg["To"] == "someone@example.com"
+    text_part, html_part, attachment_part = msg.get_payload()
+    assert text_part.get_content_type() == "text/plain"
+    assert text_part.get_content() == TEXT_BODY
+    assert html_part.get_content_type() == "text/html"
+    assert html_part.get_content() == HTML_BODY
+    assert attachment_part.get_content_type() == "application/octet-stream"
+    assert attachment_part.get_filename() == attachment_name
+    assert attachment_part.get_content() == attachment_data
+
+
+def test_send_email_without_attachment(client):
+    client.send_email("Hi", MESSAGE, "someone@example.com")
+
+    [sent] = sent_messages()
+    assert [part.get_content_type() for part in parse(sent).get_payload()] == ["text/plain", "text/html"]
+
+
+def test_send_emails(client):
+    addresses = ["one@example.com", "two@example.com", "three@example.com"]
+    responses = client.send_emails("Hi", MESSAGE, addresses)
+
+    assert len(responses) == 3
+    sent = sent_messages()
+    assert len(sent) == 3
+    for address, message in zip(addresses, sent):
+        assert set(message.destinations) == {address}
+        msg = parse(message)
+        assert msg.get_all("To") == [address]
+        assert msg["Subject"] == "Hi"
+        assert msg.get_payload()[0].get_content() == TEXT_BODY
+
+
+def test_send_emails_rejects_a_single_address(client):
+    with pytest.raises(TypeError):
+        client.send_emails("Hi", MESSAGE, "one@example.com")
+    assert sent_messages() == []
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+
+
+def run(code: str) -> str:
+    # Each check runs in a fresh interpreter, since the other tests have already imported boto3 here.
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PYTHON_DIR,
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout.strip()
+
+
+def test_import_ecs_does_not_import_boto3():
+    assert run(
+        "import sys, ecs; "
+        "print(sorted(m for m in ('boto3', 'botocore') if m in sys.modules))"
+    ) == "[]"
+
+
+def test_lazy_names_are_cached():
+    assert run(
+        "import ecs; "
+        "dynamodb = ecs.DynamoDB; "
+        "email_client = ecs.EmailClient; "
+        "print(ecs.__dict__['DynamoDB'] is dynamodb is ecs.ecs_dynamodb.DynamoDB, "
+        "ecs.__dict__['EmailClient'] is email_client is ecs.ecs_email_client.EmailClient)"
+    ) == "True True"
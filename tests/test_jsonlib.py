@@ -0,0 +1,41 @@
+import decimal
+import json
+
+import pytest
+
+import ecs
+from ecs import _jsonlib
+
+ITEM = {
+    "name": "héllo",
+    "count": decimal.Decimal("3"),
+    "readings": [decimal.Decimal("1.5"), {"max": decimal.Decimal("2.25")}]
+}
+EXPECTED = {"name": "héllo", "count": 3.0, "readings": [1.5, {"max": 2.25}]}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        if _jsonlib.orjson is None:
+            pytest.skip("orjson isn't installed")
+    else:
+        monkeypatch.setattr(_jsonlib, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_dynamodb_item_to_json(json_backend, indent):
+    result = ecs.dynamodb_item_to_json(ITEM, indent=indent)
+    assert json.loads(result) == EXPECTED
+    assert "héllo" in result
+    if indent:
+        assert f'\n{" " * indent}"name": "héllo"' in result
+
+
+def test_indent_2_is_the_same_with_or_without_orjson(monkeypatch):
+    if _jsonlib.orjson is None:
+        pytest.skip("orjson isn't installed")
+    with_orjson = ecs.dynamodb_item_to_json(ITEM, indent=2)
+    monkeypatch.setattr(_jsonlib, "orjson", None)
+    assert ecs.dynamodb_item_to_json(ITEM, indent=2) == with_orjson